@@ -35,6 +35,8 @@ It performs the following tasks:
  - <Attempted Cr> and <Earned Cr> are both floating-point numbers (e.g., 3.00)
  - <Grade> is a letter grade (e.g., A, B+, C-)
  - <Points> is a floating point value with three decimals for the number of quality points earned (= numerical grade * Earned Cr, e.g., 12.000 for an A in a 3-credit course)
+ - A course line must begin with <DEPT>, or follow a semester heading on the same line; lines starting with
+   anything else are skipped without being parsed
 
 Special topics courses have a second following line with the format: "Course Topic: <topic description>".
 
@@ -62,37 +64,93 @@ Usage:
     python3 degree_certify.py <transcript1.pdf> [<transcript2.pdf> ...]
 """
 
-import pdfplumber
-import pandas as pd
+import pymupdf
 import re
 import sys
+import csv
 import string
 import argparse
+import os
+import io
+from contextlib import redirect_stdout, redirect_stderr
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from collections import namedtuple
 from datetime import datetime
 
-RESEARCH_COURSES = {"PHY 680", "PHY 685", "PHY 690"}
-NON_CORE_ELECTIVE = {"PHY 510", "EAS 502", "EAS 520", "MTH 573", "DSC 520"}
+RESEARCH_COURSES = frozenset({"PHY 680", "PHY 685", "PHY 690"})
+NON_CORE_ELECTIVE = frozenset({"PHY 510", "EAS 502", "EAS 520", "MTH 573", "DSC 520"})
 
-# Parse command-line arguments
-parser = argparse.ArgumentParser(description="Process graduate transcript PDFs and certify degree requirements.")
-parser.add_argument("transcripts", nargs="+", help="PDF transcript files to process")
-parser.add_argument("--output-dir", default="output", help="Output directory for certification results (default: output)")
-args = parser.parse_args()
+# Classification of every explicitly listed course; whitelisted electives take precedence.
+# Unlisted courses are Core if they are PHY courses and Invalid otherwise.
+_COURSE_CLASSIFICATION = {code: "Research" for code in RESEARCH_COURSES}
+_COURSE_CLASSIFICATION.update({code: "Elective" for code in NON_CORE_ELECTIVE})
 
-PDF_FILE_LIST = args.transcripts
-OUTPUT_DIR = args.output_dir
-summary_records = []
+# One transcript course, with fields in the column order of the certification CSV
+CourseRecord = namedtuple("CourseRecord", "semester course_code title credits_earned classification grade")
+COURSE_COLUMNS = ["Semester", "Course Code", "Title", "Credits Earned", "Classification", "Grade"]
+
+# Literal markers that delimit the sections of a transcript
+GRADUATE_RECORD_MARKER = "Beginning of Graduate Record"
+TRANSFER_MARKER = "Transfer Credit from"
+COURSE_TOPIC_MARKER = "Course Topic:"
+
+# Precompiled patterns for the transcript parser. Course grades include "T" for transfer credits.
+_NAME_RE = re.compile(r"Name:\s+(.+)")
+_ID_RE = re.compile(r"Student ID:\s+(\d+)")
+# Semester headings and course lines share one alternation; the semester branch is anchored to the line start.
+_LINE_RE = re.compile(
+    r"(?P<sem>^\s*(?P<year>\d{4})\s+(?P<term>Fall|Spring|Sprng))"
+    r"|(?P<course>(?P<code>[A-Z]{3}\s+\d+)\s+(?P<title>.+?)\s+(?P<attempted>\d\.\d{2})\s+(?P<earned>\d\.\d{2})"
+    r"\s+(?P<grade>[A-FT][+-]?)\s+(?P<points>\d+\.\d{3}))"
+)
+_LEVEL_RE = re.compile(r"\b(\d{3})\b")
+
+# Only plain word text is needed: ligatures are expanded and nothing outside the page is kept
+_WORD_FLAGS = pymupdf.TEXT_MEDIABOX_CLIP
+
+# Translation table that deletes punctuation when building output filenames
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
 
 def get_course_level(course_code):
-    match = re.search(r"\b(\d{3})\b", course_code)
+    # Fast path for the usual "PHY 543" shape; anything else falls back to the regex
+    if len(course_code) == 7 and course_code[3] == " " and course_code[4:].isdigit():
+        return int(course_code[4:])
+    match = _LEVEL_RE.search(course_code)
     return int(match.group(1)) if match else None
 
-# The transcript is assumed to be have a two-column layout. We extract both.
-def extract_column_text(page, left_col_bbox, right_col_bbox):
-    left_lines = page.crop(left_col_bbox).extract_text().splitlines() if page.crop(left_col_bbox).extract_text() else []
-    right_lines = page.crop(right_col_bbox).extract_text().splitlines() if page.crop(right_col_bbox).extract_text() else []
-    return left_lines + right_lines
+def words_to_lines(words, y_tolerance=3):
+    """Group PyMuPDF word tuples into text lines, ordered top-to-bottom and left-to-right."""
+    lines = []
+    current_words = []
+    current_top = None
+    for word in sorted(words, key=lambda w: (w[1], w[0])):
+        if current_words and word[1] - current_top > y_tolerance:
+            lines.append(" ".join(w[4] for w in sorted(current_words)))
+            current_words = []
+        if not current_words:
+            current_top = word[1]
+        current_words.append(word)
+    if current_words:
+        lines.append(" ".join(w[4] for w in sorted(current_words)))
+    return lines
+
+# The transcript is assumed to be have a two-column layout. Words from a single page extraction
+# are split at the page midline and each column is read top-to-bottom, left column first.
+def iter_column_lines(words, midline):
+    left_words = []
+    right_words = []
+    add_left = left_words.append
+    add_right = right_words.append
+    for word in words:
+        if word[0] < midline:
+            add_left(word)
+        else:
+            add_right(word)
+    # Lines are yielded lazily; the right column is only grouped once the left column is consumed
+    yield from words_to_lines(left_words)
+    yield from words_to_lines(right_words)
 
 def extract_courses_and_student_info(pdf_path):
     print(f"Opening PDF: {pdf_path}")
@@ -105,47 +163,46 @@ def extract_courses_and_student_info(pdf_path):
     in_potential_transfer_section = False  # Track potential transfer credits (buffered until confirmed)
     transfer_buffer = []  # Buffer to hold potential transfer courses until we confirm they precede graduate record
     transfer_semester = ""  # Track semester for buffered transfer courses
+    line_search = _LINE_RE.search  # Bound once for the per-line loop
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            print(f"PDF opened successfully, {len(pdf.pages)} pages")
-            page_width = pdf.pages[0].width
-            page_height = pdf.pages[0].height
-            left_col_bbox = (0, 0, page_width / 2, page_height)
-            right_col_bbox = (page_width / 2, 0, page_width, page_height)
-
-            for page in pdf.pages:
-                if not student_name or not student_id:
-                    full_text = page.extract_text()
-                    if full_text:
-                        for line in full_text.splitlines():
-                            if not student_name:
-                                name_match = re.match(r"Name:\s+(.+)", line)
-                                if name_match:
-                                    student_name = name_match.group(1).strip()
-                            if not student_id:
-                                id_match = re.match(r"Student ID:\s+(\d+)", line)
-                                if id_match:
-                                    student_id = id_match.group(1).strip()
-
-                lines = extract_column_text(page, left_col_bbox, right_col_bbox)
-
-                for line in lines:
-                    # Check for beginning of graduate record - this confirms any buffered transfer credits
-                    if "Beginning of Graduate Record" in line:
-                        # Commit any buffered transfer courses - they immediately preceded the graduate record
-                        if transfer_buffer:
-                            print(f"Committing {len(transfer_buffer)} transfer courses to graduate record")
-                            course_records.extend(transfer_buffer)
-                            transfer_buffer = []
-                        in_graduate_section = True
-                        in_potential_transfer_section = False
-                        print("Found graduate section marker")
-                        continue
+        with pymupdf.open(pdf_path) as pdf:
+            print(f"PDF opened successfully, {pdf.page_count} pages")
+            midline = pdf[0].rect.width / 2
 
-                    # Check for transfer credit section - buffer courses until we confirm they precede graduate record
+            for page in pdf:
+                words = page.get_text("words", flags=_WORD_FLAGS)
+                if not student_name or not student_id:
+                    for line in words_to_lines(words):
+                        if not student_name and line.startswith("Name:"):
+                            name_match = _NAME_RE.match(line)
+                            if name_match:
+                                student_name = name_match.group(1).strip()
+                        if not student_id and line.startswith("Student ID:"):
+                            id_match = _ID_RE.match(line)
+                            if id_match:
+                                student_id = id_match.group(1).strip()
+                        if student_name and student_id:
+                            break
+
+                for line in iter_column_lines(words, midline):
+                    # Section markers only matter until the graduate record begins, so graduate-section
+                    # lines skip these scans entirely
                     if not in_graduate_section:
-                        if "Transfer Credit from" in line:
+                        # Check for beginning of graduate record - this confirms any buffered transfer credits
+                        if GRADUATE_RECORD_MARKER in line:
+                            # Commit any buffered transfer courses - they immediately preceded the graduate record
+                            if transfer_buffer:
+                                print(f"Committing {len(transfer_buffer)} transfer courses to graduate record")
+                                course_records.extend(transfer_buffer)
+                                transfer_buffer = []
+                            in_graduate_section = True
+                            in_potential_transfer_section = False
+                            print("Found graduate section marker")
+                            continue
+
+                        # Check for transfer credit section - buffer courses until we confirm they precede graduate record
+                        if TRANSFER_MARKER in line:
                             # New transfer section - clear any previous buffer (it wasn't followed by graduate record)
                             if transfer_buffer:
                                 print(f"Discarding {len(transfer_buffer)} buffered courses (not followed by graduate record)")
@@ -162,101 +219,99 @@ def extract_courses_and_student_info(pdf_path):
                     # Determine which list to add courses to
                     target_list = transfer_buffer if (in_potential_transfer_section and not in_graduate_section) else course_records
 
-                    sem_match = re.match(r"\s*(\d{4})\s+(Fall|Spring|Sprng)", line)
-                    if sem_match:
+                    # Special topics lines carry no course record, so handle them before any regex work
+                    if COURSE_TOPIC_MARKER in line:
+                        if buffer_special_topics:
+                            topic = line.split(COURSE_TOPIC_MARKER)[-1].strip()
+                            target_list.append(buffer_special_topics._replace(title=f"Special Topics: {topic}"))
+                            buffer_special_topics = None
+                        continue
+
+                    # Semester headings start with a year and course lines with a "<DEPT> " prefix, so
+                    # other lines (totals, column labels, plan text) skip the regex entirely
+                    head = line.lstrip()[:4]
+                    if head[:1].isdigit() or (head[:3].isalpha() and head[:3].isupper() and head[3:] == " "):
+                        # A single scan finds either a semester heading or a course
+                        line_match = line_search(line)
+                    else:
+                        line_match = None
+                    if line_match and line_match.group("sem"):
                         if buffer_special_topics:
                             target_list.append(buffer_special_topics)
                             buffer_special_topics = None
-                        year = sem_match.group(1)[-2:]
-                        term = sem_match.group(2).replace("Sprng", "Spring")
+                        year = line_match.group("year")[-2:]
+                        term = line_match.group("term").replace("Sprng", "Spring")
                         current_semester = f"{'F' if term == 'Fall' else 'S'}{year}"
+                        # A course may share the line with its semester heading
+                        line_match = line_search(line, line_match.end())
 
                     # Match courses - include "T" grade for transfer credits
-                    course_match = re.search(
-                        r"([A-Z]{3}\s+\d+)\s+(.+?)\s+(\d\.\d{2})\s+(\d\.\d{2})\s+([A-FT][+-]?)\s+(\d+\.\d{3})", line
-                    )
+                    course_match = line_match
                     if course_match:
                         if buffer_special_topics:
                             target_list.append(buffer_special_topics)
                             buffer_special_topics = None
 
-                        course_code = course_match.group(1).strip()
-                        title = course_match.group(2).strip()
-                        earned_credits = float(course_match.group(4))
-                        grade = course_match.group(5)
+                        course_code = course_match.group("code").strip()
+                        title = course_match.group("title").strip()
+                        earned_credits = float(course_match.group("earned"))
+                        grade = course_match.group("grade")
                         is_transfer = (grade == "T")
 
-                        prefix = course_code.split()[0]
-
                         # Add "(Transfer)" suffix to title for transfer courses
                         display_title = f"{title} (Transfer)" if is_transfer else title
 
-                        if course_code in NON_CORE_ELECTIVE:
-                            buffer_special_topics = {
-                                "Semester": current_semester,
-                                "Course Code": course_code,
-                                "Title": "Special Topics in Physics" + (" (Transfer)" if is_transfer else ""),
-                                "Credits Earned": earned_credits,
-                                "Grade": grade,
-                                "Classification": "Elective"
-                            }
-                        elif prefix == "PHY":
-                            classification = "Research" if course_code in RESEARCH_COURSES else "Core"
-                            target_list.append({
-                                "Semester": current_semester,
-                                "Course Code": course_code,
-                                "Title": display_title,
-                                "Credits Earned": earned_credits,
-                                "Grade": grade,
-                                "Classification": classification
-                            })
+                        classification = _COURSE_CLASSIFICATION.get(course_code)
+                        if classification is None:
+                            classification = "Core" if course_code.startswith("PHY ") else "Invalid"
+
+                        if classification == "Elective":
+                            buffer_special_topics = CourseRecord(
+                                current_semester, course_code,
+                                "Special Topics in Physics" + (" (Transfer)" if is_transfer else ""),
+                                earned_credits, classification, grade
+                            )
                         else:
-                            target_list.append({
-                                "Semester": current_semester,
-                                "Course Code": course_code,
-                                "Title": display_title,
-                                "Credits Earned": earned_credits,
-                                "Grade": grade,
-                                "Classification": "Invalid"
-                            })
-
-                    elif "Course Topic:" in line and buffer_special_topics:
-                        topic = line.split("Course Topic:")[-1].strip()
-                        buffer_special_topics["Title"] = f"Special Topics: {topic}"
-                        target_list.append(buffer_special_topics)
-                        buffer_special_topics = None
+                            target_list.append(CourseRecord(
+                                current_semester, course_code, display_title, earned_credits, classification, grade
+                            ))
 
         if buffer_special_topics:
             course_records.append(buffer_special_topics)
 
         print(f"Found {len(course_records)} course records")
-        return student_name, student_id, pd.DataFrame(course_records)
+        return student_name, student_id, course_records
     
     except Exception as e:
         print(f"Error opening PDF: {e}")
         import traceback
         traceback.print_exc()
-        return None, None, pd.DataFrame()
+        return None, None, []
+
+def format_table(columns, rows):
+    """Render rows as right-aligned text columns for the terminal report."""
+    cells = [[str(column) for column in columns]] + [[str(value) for value in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(columns))]
+    return "\n".join(" ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in cells)
 
-def generate_certification_csv_and_display(student_name, student_id, df, output_dir="output"):
+def generate_certification_csv_and_display(student_name, student_id, course_records, output_dir="output"):
     print(f"Processing certification for {student_name}")
     
     # Check for invalid courses but continue processing
-    has_invalid_courses = any(df["Classification"] == "Invalid")
+    has_invalid_courses = any(record.classification == "Invalid" for record in course_records)
     
-    df = df[["Semester", "Course Code", "Title", "Credits Earned", "Classification", "Grade"]]
-    df = df.sort_values(by=["Classification", "Semester", "Course Code"])
+    course_records = sorted(course_records, key=lambda r: (r.classification, r.semester, r.course_code))
 
+    # A plain loop is plenty for the few dozen rows on a transcript
     total_credits = 0
     core_credits = 0
     research_credits = 0
     four_xx_credits = 0
 
-    for _, row in df.iterrows():
-        course_code = row["Course Code"]
-        credits = row["Credits Earned"]
-        classification = row["Classification"]
-        level = get_course_level(course_code)
+    for record in course_records:
+        credits = record.credits_earned
+        classification = record.classification
+        level = get_course_level(record.course_code)
 
         # Skip invalid courses and courses below 400 level for credit counting
         if classification == "Invalid" or level is None or level < 400:
@@ -267,7 +322,7 @@ def generate_certification_csv_and_display(student_name, student_id, df, output_
             core_credits += credits
         if classification == "Research":
             research_credits += credits
-        if 400 <= level < 500:
+        if level < 500:
             four_xx_credits += credits
 
     # This is where the certification logic is applied
@@ -278,20 +333,10 @@ def generate_certification_csv_and_display(student_name, student_id, df, output_
     four_xx_ok = four_xx_credits <= 6
     certification_ok = all([core_ok, total_ok, research_ok, four_xx_ok]) and not has_invalid_courses
 
-    summary_row = pd.DataFrame([{
-        "Semester": "",
-        "Course Code": "",
-        "Title": "Total Credits Applied",
-        "Credits Earned": total_credits,
-        "Classification": "",
-        "Grade": ""
-    }])
-    df_final = pd.concat([df, summary_row], ignore_index=True)
-
     quoted_id = f'="{student_id}"'
     names = student_name.lower().split()
     first_initial = names[0][0]
-    clean_names = [n.strip(string.punctuation) for n in names if n.strip(string.punctuation).isalpha()]
+    clean_names = [n for n in student_name.lower().translate(_PUNCTUATION_TABLE).split() if n.isalpha()]
     last_name = clean_names[-1] if clean_names else names[-1]
     # Include student ID in the filename for uniqueness
     filename = f"{first_initial}{last_name}_{student_id}_ms_phy_track.csv"
@@ -309,31 +354,34 @@ def generate_certification_csv_and_display(student_name, student_id, df, output_
         ["Student ID", quoted_id]
     ]
 
-    requirements = pd.DataFrame([
-        ["**Graduation Requirement**", "≥15 Core Credits", int(core_credits), "Verified" if core_ok else "Not Met"],
-        ["", "≤6 Research Credits Applied", int(research_applied), "Verified" if research_ok else "Not Met"],
-        ["", "≤6 400-Level Credits Applied", int(four_xx_credits), "Verified" if four_xx_ok else "Not Met"],
-        ["", "≥30 Total Credits", int(total_credits), "Verified" if total_ok else "Not Met"]
-    ], columns=["", "Requirement", "Value", "Status"])
+    requirements = [
+        ("**Graduation Requirement**", "≥15 Core Credits", int(core_credits), "Verified" if core_ok else "Not Met"),
+        ("", "≤6 Research Credits Applied", int(research_applied), "Verified" if research_ok else "Not Met"),
+        ("", "≤6 400-Level Credits Applied", int(four_xx_credits), "Verified" if four_xx_ok else "Not Met"),
+        ("", "≥30 Total Credits", int(total_credits), "Verified" if total_ok else "Not Met")
+    ]
 
     # Add invalid course requirement if applicable
     if has_invalid_courses:
-        invalid_row = pd.DataFrame([
-            ["", "No Invalid External Courses", "FOUND", "Not Met"]
-        ], columns=["", "Requirement", "Value", "Status"])
-        requirements = pd.concat([requirements, invalid_row], ignore_index=True)
+        requirements.append(("", "No Invalid External Courses", "FOUND", "Not Met"))
 
     # Always generate CSV file regardless of certification status
     try:
         with open(output_path, "w", newline='') as f:
+            # Header lines are written verbatim so the ="..." ID formula reaches the spreadsheet unquoted
             for row in header_lines:
                 f.write(",".join(row) + "\n")
-            df_final.to_csv(f, index=False)
-            f.write("\n")
-            requirements.to_csv(f, index=False, header=False)
-            
+            # One writer for every tabular section of the file
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(COURSE_COLUMNS)
+            writer.writerows(course_records)
+            writer.writerow(["", "", "Total Credits Applied", total_credits, "", ""])
+            writer.writerow([])
+            writer.writerows(requirements)
+
             # Add final status line at the bottom for extra clarity
-            f.write(f"\nFINAL STATUS,{certification_status}\n")
+            writer.writerow([])
+            writer.writerow(["FINAL STATUS", certification_status])
 
         if certification_ok:
             print(f"Certification PASSED. CSV saved to: {output_path.resolve()}")
@@ -343,9 +391,12 @@ def generate_certification_csv_and_display(student_name, student_id, df, output_
             print(f"CSV saved to: {output_path.resolve()}")
 
         print("\nCourse Record:")
-        print(df_final.to_string(index=False))
+        print(format_table(COURSE_COLUMNS, course_records))
+        print(f"Total Credits Applied: {total_credits}")
         print("\nGraduation Requirements:")
-        print(requirements.to_string(index=False))
+        print(f"{'':<26} {'Requirement':<28} {'Value':>6} Status")
+        for label, requirement, value, status in requirements:
+            print(f"{label:<26} {requirement:<28} {value!s:>6} {status}")
 
     except Exception as e:
         print(f"Error writing CSV file for {student_name}: {e}")
@@ -363,38 +414,80 @@ def generate_certification_csv_and_display(student_name, student_id, df, output_
         "Certification Date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     }
 
-# Main processing loop
-for pdf_path in PDF_FILE_LIST:
+def process_one_pdf(pdf_path, output_dir):
+    """Certify a single transcript and return its summary row, or None if it could not be processed."""
     print(f"Processing: {pdf_path}")
     try:
-        student_name, student_id, course_df = extract_courses_and_student_info(pdf_path)
+        student_name, student_id, course_records = extract_courses_and_student_info(pdf_path)
         print(f"Extracted - Name: {student_name}, ID: {student_id}")
-        print(f"Course dataframe shape: {course_df.shape}")
+        print(f"Course records: {len(course_records)}")
         
-        if student_name and student_id and not course_df.empty:
+        if student_name and student_id and course_records:
             print("Calling generate_certification_csv_and_display...")
-            summary_row = generate_certification_csv_and_display(student_name, student_id, course_df, output_dir=OUTPUT_DIR)
+            summary_row = generate_certification_csv_and_display(student_name, student_id, course_records, output_dir=output_dir)
             print(f"Generated summary: {summary_row}")
-            summary_records.append(summary_row)
+            return summary_row
         else:
             print(f"Could not extract student name or ID from: {pdf_path}")
-            if course_df.empty:
+            if not course_records:
                 print("No course records found - check if 'Beginning of Graduate Record' marker exists")
     except Exception as e:
         print(f"Error processing {pdf_path}: {e}")
         import traceback
         traceback.print_exc()
-
-if summary_records:
-    summary_df = pd.DataFrame(summary_records)
-    summary_output_path = Path(OUTPUT_DIR) / "certification_summary.csv"
-    summary_output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Append to existing file or create new one with headers
-    file_exists = summary_output_path.exists()
-    summary_df.to_csv(summary_output_path, mode='a', index=False, header=not file_exists)
-
-    action = "appended to" if file_exists else "created"
-    print(f"\nSummary CSV {action}: {summary_output_path.resolve()}")
-else:
-    print("No records processed successfully.")
+    return None
+
+def process_one_pdf_captured(pdf_path, output_dir):
+    """
+    Certify a single transcript in a worker process, capturing its console output so the parent
+    can print each transcript's report whole. Returns (summary_row, stdout text, stderr text).
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        summary_row = process_one_pdf(pdf_path, output_dir)
+    return summary_row, stdout.getvalue(), stderr.getvalue()
+
+def main(argv=None):
+    # Parse command-line arguments (argv defaults to sys.argv[1:], as with argparse)
+    parser = argparse.ArgumentParser(description="Process graduate transcript PDFs and certify degree requirements.")
+    parser.add_argument("transcripts", nargs="+", help="PDF transcript files to process")
+    parser.add_argument("--output-dir", default="output", help="Output directory for certification results (default: output)")
+    args = parser.parse_args(argv)
+
+    # Each transcript is independent, so batches are certified in parallel worker processes.
+    # map() yields the results in command-line order, and each worker's captured report is
+    # printed here as its result arrives, so reports never interleave. A single transcript
+    # is processed in-process, since a worker would only add process startup cost.
+    max_workers = min(len(args.transcripts), os.cpu_count() or 1)
+    if max_workers > 1:
+        results = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for summary_row, stdout, stderr in executor.map(
+                    process_one_pdf_captured, args.transcripts, repeat(args.output_dir)):
+                sys.stdout.write(stdout)
+                sys.stderr.write(stderr)
+                results.append(summary_row)
+    else:
+        results = [process_one_pdf(pdf_path, args.output_dir) for pdf_path in args.transcripts]
+    summary_records = [summary_row for summary_row in results if summary_row]
+
+    if summary_records:
+        summary_output_path = Path(args.output_dir) / "certification_summary.csv"
+        summary_output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Append to existing file or create new one with headers; an append-mode file starts
+        # positioned at its end, so an empty position means there is no header yet
+        with summary_output_path.open("a", newline='') as f:
+            file_exists = f.tell() > 0
+            writer = csv.DictWriter(f, fieldnames=list(summary_records[0]), lineterminator="\n")
+            if not file_exists:
+                writer.writeheader()
+            writer.writerows(summary_records)
+
+        action = "appended to" if file_exists else "created"
+        print(f"\nSummary CSV {action}: {summary_output_path.resolve()}")
+    else:
+        print("No records processed successfully.")
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 generate_test_transcripts.py
 
 Generates synthetic PDF transcripts for testing degree_certify.py.
-Creates 9 test cases: 5 passing and 4 failing certification scenarios.
+Creates 10 test cases: 5 passing and 5 failing certification scenarios.
 
 Transcripts use a realistic two-column layout matching actual university transcripts.
 """
@@ -11,7 +11,36 @@ Transcripts use a realistic two-column layout matching actual university transcr
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+import os
 from pathlib import Path
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Layout constants (points). Column offsets are relative to the left edge of the current column.
+COL_DESC_DX = 0.55 * inch
+COL_ATMPT_DX = 2.0 * inch
+COL_EARN_DX = 2.4 * inch
+COL_GRADE_DX = 2.75 * inch
+COL_POINTS_DX = 3.1 * inch
+
+ROW_DY = 0.15 * inch            # One course or column-label row
+TERM_HEADER_DY = 0.18 * inch    # Term name above the column labels
+TOTALS_GAP_DY = 0.05 * inch     # Space between the last course and the term totals
+TOTALS_DY = 0.13 * inch         # Term totals line to cum totals line
+BLOCK_GAP_DY = 0.25 * inch      # Space after a term block or section marker
+
+PAGE_MARGIN = 0.75 * inch       # Bottom margin, and top margin on continuation pages
+COURSE_LINE_HEIGHT = 0.18 * inch
+SEMESTER_HEADER_HEIGHT = 0.5 * inch
+SEMESTER_TOTALS_HEIGHT = 0.4 * inch
+
+# Page header lines centred above the two columns; their x positions are measured once here
+HEADER_TITLE = "UNOFFICIAL ACADEMIC TRANSCRIPT"
+HEADER_INSTITUTION = "Westbrook State University"
+HEADER_TITLE_X = (letter[0] - stringWidth(HEADER_TITLE, "Helvetica-Bold", 14)) / 2
+HEADER_INSTITUTION_X = (letter[0] - stringWidth(HEADER_INSTITUTION, "Helvetica", 10)) / 2
 
 
 # Standard undergraduate curriculum (~120 credits over 8 semesters)
@@ -105,39 +134,104 @@ UNDERGRAD_SEMESTERS = [
 ]
 
 
+# Titles of the graduate courses used by the test cases, keyed by course code
+GRAD_COURSE_TITLES = {
+    'BIO 520': 'Advanced Biology',
+    'EAS 502': 'Earth Science',
+    'EAS 520': 'Earth System Science',
+    'MTH 573': 'Numerical Analysis',
+    'PHY 412': 'Elec & Magnt Fields II',
+    'PHY 415': 'Advanced Lab I',
+    'PHY 416': 'Advanced Lab II',
+    'PHY 510': 'Mathematical Methods',
+    'PHY 521': 'Electrodynamics I',
+    'PHY 522': 'Electrodynamics II',
+    'PHY 543': 'Quantum Mechanics I',
+    'PHY 544': 'Quantum Mechanics II',
+    'PHY 561': 'Classical Mechanics',
+    'PHY 571': 'Statistical Mechanics',
+    'PHY 680': 'Independent Study',
+    'PHY 690': 'Graduate Thesis',
+}
+
+
+GRADE_POINTS = {
+    'A+': 4.0, 'A': 4.0, 'A-': 3.7,
+    'B+': 3.3, 'B': 3.0, 'B-': 2.7,
+    'C+': 2.3, 'C': 2.0, 'C-': 1.7,
+    'D+': 1.3, 'D': 1.0, 'D-': 0.7,
+    'F': 0.0, 'T': 0.0
+}
+
+
 def grade_to_points(grade):
     """Convert letter grade to grade points."""
-    grade_map = {
-        'A+': 4.0, 'A': 4.0, 'A-': 3.7,
-        'B+': 3.3, 'B': 3.0, 'B-': 2.7,
-        'C+': 2.3, 'C': 2.0, 'C-': 1.7,
-        'D+': 1.3, 'D': 1.0, 'D-': 0.7,
-        'F': 0.0, 'T': 0.0
-    }
-    return grade_map.get(grade, 0.0)
+    return GRADE_POINTS.get(grade, 0.0)
+
+
+def prepare_courses(courses):
+    """Store each course's grade points and display strings on its dict so drawing does not recompute them."""
+    for course in courses:
+        course['points'] = grade_to_points(course.get('grade', 'A')) * course['credits']
+        course['points_str'] = f"{course['points']:.3f}"
+        course['code'] = f"{course['dept']} {course['num']}"
+        course['title18'] = course['title'][:18]  # Truncated to fit the description column
+        course['credits_str'] = f"{course['credits']:.2f}"
+
+
+def expand_semesters(table):
+    """Build semester dicts from (term, [(course code, credits, grade), ...]) rows, titled from GRAD_COURSE_TITLES."""
+    semesters = []
+    for term, courses in table:
+        semesters.append({
+            'term': term,
+            'courses': [
+                {'dept': code[:3], 'num': code[4:], 'title': GRAD_COURSE_TITLES[code],
+                 'credits': credits, 'grade': grade}
+                for code, credits, grade in courses
+            ]
+        })
+    return semesters
+
+
+for _sem_data in UNDERGRAD_SEMESTERS:
+    prepare_courses(_sem_data['courses'])
 
 
 class TranscriptGenerator:
     """Generates two-column PDF transcripts."""
 
+    __slots__ = (
+        'filename', 'student_name', 'student_id', 'c', 'width', 'height',
+        'left_col_x', 'right_col_x', 'col_width', 'col_x', 'col_y', 'col_idx',
+        'cum_attempted', 'cum_earned', 'cum_gpa_units', 'cum_points', 'cur_font',
+    )
+
     def __init__(self, filename, student_name, student_id):
         self.filename = str(filename)
         self.student_name = student_name
         self.student_id = student_id
-        Path(filename).parent.mkdir(parents=True, exist_ok=True)
 
-        self.c = canvas.Canvas(self.filename, pagesize=letter)
+        # generate_all_test_transcripts creates its output directory once; direct callers may
+        # pass a path in a directory that does not exist yet
+        parent = Path(self.filename).parent
+        if not parent.exists():
+            parent.mkdir(parents=True, exist_ok=True)
+
+        # Compressed content streams; invariant output (no timestamps or random IDs) so
+        # regenerating unchanged transcripts produces byte-identical files
+        self.c = canvas.Canvas(self.filename, pagesize=letter, pageCompression=1, invariant=1)
         self.width, self.height = letter
 
         # Column positions
         self.left_col_x = 0.4 * inch
         self.right_col_x = self.width / 2 + 0.2 * inch
         self.col_width = self.width / 2 - 0.6 * inch
+        self.col_x = (self.left_col_x, self.right_col_x)
 
         # Track position in each column (start well below header area)
-        self.left_y = self.height - 1.7 * inch
-        self.right_y = self.height - 1.7 * inch
-        self.current_col = 'left'  # Start with left column
+        self.col_y = [self.height - 1.7 * inch, self.height - 1.7 * inch]
+        self.col_idx = 0  # 0 = left column, 1 = right column
 
         # Cumulative totals
         self.cum_attempted = 0.0
@@ -145,65 +239,86 @@ class TranscriptGenerator:
         self.cum_gpa_units = 0.0
         self.cum_points = 0.0
 
+        # Font last set on the canvas for the current page, so unchanged fonts are not re-emitted
+        self.cur_font = None
+
         # Draw header on first page
         self._draw_header()
 
     def _draw_header(self):
         """Draw the transcript header in a single-column area above the two-column content."""
         y = self.height - 0.5 * inch
-        self.c.setFont("Helvetica-Bold", 14)
-        self.c.drawCentredString(self.width / 2, y, "UNOFFICIAL ACADEMIC TRANSCRIPT")
+        lines = [(HEADER_TITLE_X, y, "Helvetica-Bold", 14, HEADER_TITLE)]
 
         y -= 0.25 * inch
-        self.c.setFont("Helvetica", 10)
-        self.c.drawCentredString(self.width / 2, y, "Westbrook State University")
+        lines.append((HEADER_INSTITUTION_X, y, "Helvetica", 10, HEADER_INSTITUTION))
 
         y -= 0.35 * inch
-        self.c.setFont("Helvetica", 10)
-        self.c.drawString(0.5 * inch, y, f"Name: {self.student_name}")
+        lines.append((0.5 * inch, y, "Helvetica", 10, f"Name: {self.student_name}"))
         y -= 0.2 * inch
-        self.c.drawString(0.5 * inch, y, f"Student ID: {self.student_id}")
+        lines.append((0.5 * inch, y, "Helvetica", 10, f"Student ID: {self.student_id}"))
+        self._draw_text_block(lines)
 
         # Draw a separator line to clearly end the header area
         y -= 0.15 * inch
         self.c.line(0.5 * inch, y, self.width - 0.5 * inch, y)
 
+    def _set_font(self, name, size):
+        """Set the canvas font, skipping the call when it is already active on this page."""
+        if (name, size) != self.cur_font:
+            self.c.setFont(name, size)
+            self.cur_font = (name, size)
+
     def _get_current_x(self):
         """Get x position for current column."""
-        return self.left_col_x if self.current_col == 'left' else self.right_col_x
+        return self.col_x[self.col_idx]
 
     def _get_current_y(self):
         """Get y position for current column."""
-        return self.left_y if self.current_col == 'left' else self.right_y
+        return self.col_y[self.col_idx]
 
     def _set_current_y(self, y):
         """Set y position for current column."""
-        if self.current_col == 'left':
-            self.left_y = y
-        else:
-            self.right_y = y
+        self.col_y[self.col_idx] = y
 
     def _advance_y(self, amount):
         """Move down by amount in current column."""
-        if self.current_col == 'left':
-            self.left_y -= amount
-        else:
-            self.right_y -= amount
+        self.col_y[self.col_idx] -= amount
 
     def _check_page_break(self, needed_height):
         """Check if we need to switch columns or pages."""
-        current_y = self._get_current_y()
-
-        if current_y - needed_height < 0.75 * inch:
-            if self.current_col == 'left':
+        if self.col_y[self.col_idx] - needed_height < PAGE_MARGIN:
+            if self.col_idx == 0:
                 # Switch to right column
-                self.current_col = 'right'
+                self.col_idx = 1
             else:
                 # Need new page
                 self.c.showPage()
-                self.left_y = self.height - 0.75 * inch
-                self.right_y = self.height - 0.75 * inch
-                self.current_col = 'left'
+                self.cur_font = None  # A new page starts with reportlab's default font
+                self.col_y = [self.height - PAGE_MARGIN, self.height - PAGE_MARGIN]
+                self.col_idx = 0
+
+    def _draw_row(self, x, y, cells):
+        """Draw (x offset, text) cells on one baseline as a single text object in the current font."""
+        row = self.c.beginText(x, y)
+        for dx, text in cells:
+            row.setTextOrigin(x + dx, y)
+            row.textOut(text)
+        self.c.drawText(row)
+
+    def _draw_text_block(self, lines):
+        """Draw (x, y, font name, font size, text) lines as a single text object."""
+        block = self.c.beginText()
+        font = None
+        for x, y, name, size, text in lines:
+            if (name, size) != font:
+                font = (name, size)
+                block.setFont(name, size)
+            block.setTextOrigin(x, y)
+            block.textOut(text)
+        self.c.drawText(block)
+        # Fonts set inside a text object bypass the canvas, so the next _set_font must emit its font
+        self.cur_font = None
 
     def _draw_section_marker(self, text):
         """Draw a section marker like 'Beginning of Graduate Record'."""
@@ -211,59 +326,63 @@ class TranscriptGenerator:
         x = self._get_current_x()
         y = self._get_current_y()
 
-        self.c.setFont("Helvetica-Bold", 9)
+        self._set_font("Helvetica-Bold", 9)
         self.c.drawString(x, y, f"---------- {text} ----------")
-        self._advance_y(0.25 * inch)
+        self._advance_y(BLOCK_GAP_DY)
 
     def _draw_semester_header(self, term):
         """Draw semester header with column labels."""
-        self._check_page_break(0.5 * inch)
+        self._check_page_break(SEMESTER_HEADER_HEIGHT)
         x = self._get_current_x()
         y = self._get_current_y()
 
         # Term header
-        self.c.setFont("Helvetica-Bold", 9)
+        self._set_font("Helvetica-Bold", 9)
         self.c.drawString(x, y, term)
-        self._advance_y(0.18 * inch)
+        y -= TERM_HEADER_DY
 
         # Column headers
-        y = self._get_current_y()
-        self.c.setFont("Helvetica", 7)
-        self.c.drawString(x, y, "Course")
-        self.c.drawString(x + 0.55 * inch, y, "Description")
-        self.c.drawString(x + 2.0 * inch, y, "Atmpt")
-        self.c.drawString(x + 2.4 * inch, y, "Earn")
-        self.c.drawString(x + 2.75 * inch, y, "Grade")
-        self.c.drawString(x + 3.1 * inch, y, "Points")
-        self._advance_y(0.15 * inch)
-
-    def _draw_course_line(self, course, is_transfer=False):
-        """Draw a single course line."""
-        self._check_page_break(0.18 * inch)
+        self._set_font("Helvetica", 7)
+        self._draw_row(x, y, (
+            (0, "Course"),
+            (COL_DESC_DX, "Description"),
+            (COL_ATMPT_DX, "Atmpt"),
+            (COL_EARN_DX, "Earn"),
+            (COL_GRADE_DX, "Grade"),
+            (COL_POINTS_DX, "Points"),
+        ))
+        self._set_current_y(y - ROW_DY)
+
+    def _draw_course_row(self, course, grade, points_str):
+        """Draw a single course line with the given grade and points columns."""
+        self._check_page_break(COURSE_LINE_HEIGHT)
         x = self._get_current_x()
         y = self._get_current_y()
 
-        grade = 'T' if is_transfer else course.get('grade', 'A')
-        credits = course['credits']
-        points = 0.0 if is_transfer else grade_to_points(grade) * credits
-
-        self.c.setFont("Helvetica", 8)
-        self.c.drawString(x, y, f"{course['dept']} {course['num']}")
-        # Truncate title if too long
-        title = course['title'][:18]
-        self.c.drawString(x + 0.55 * inch, y, title)
-        self.c.drawString(x + 2.0 * inch, y, f"{credits:.2f}")
-        self.c.drawString(x + 2.4 * inch, y, f"{credits:.2f}")
-        self.c.drawString(x + 2.75 * inch, y, grade)
-        self.c.drawString(x + 3.1 * inch, y, f"{points:.3f}")
-        self._advance_y(0.15 * inch)
-
-        return credits, credits, points
+        self._set_font("Helvetica", 8)
+        self._draw_row(x, y, (
+            (0, course['code']),
+            (COL_DESC_DX, course['title18']),
+            (COL_ATMPT_DX, course['credits_str']),
+            (COL_EARN_DX, course['credits_str']),
+            (COL_GRADE_DX, grade),
+            (COL_POINTS_DX, points_str),
+        ))
+        self._advance_y(ROW_DY)
+
+    def _draw_course_line(self, course):
+        """Draw a graded course line. Returns (attempted, earned, points)."""
+        self._draw_course_row(course, course.get('grade', 'A'), course['points_str'])
+        return course['credits'], course['credits'], course['points']
+
+    def _draw_transfer_course_line(self, course):
+        """Draw a transfer course line, graded T with no grade points. Returns (attempted, earned, points)."""
+        self._draw_course_row(course, 'T', "0.000")
+        return course['credits'], course['credits'], 0.0
 
     def _draw_term_totals(self, term_attempted, term_earned, term_points):
         """Draw term GPA and totals."""
         x = self._get_current_x()
-        y = self._get_current_y()
 
         term_gpa = term_points / term_earned if term_earned > 0 else 0.0
 
@@ -274,31 +393,33 @@ class TranscriptGenerator:
         self.cum_points += term_points
         cum_gpa = self.cum_points / self.cum_gpa_units if self.cum_gpa_units > 0 else 0.0
 
-        self.c.setFont("Helvetica", 7)
+        self._set_font("Helvetica", 7)
 
         # Term totals line
-        self._advance_y(0.05 * inch)
-        y = self._get_current_y()
-        self.c.drawString(x, y, "Term Totals:")
-        self.c.drawString(x + 2.0 * inch, y, f"{term_attempted:.2f}")
-        self.c.drawString(x + 2.4 * inch, y, f"{term_earned:.2f}")
-        self.c.drawString(x + 2.75 * inch, y, f"{term_gpa:.3f}")
-        self.c.drawString(x + 3.1 * inch, y, f"{term_points:.3f}")
-        self._advance_y(0.13 * inch)
+        y = self._get_current_y() - TOTALS_GAP_DY
+        self._draw_row(x, y, (
+            (0, "Term Totals:"),
+            (COL_ATMPT_DX, f"{term_attempted:.2f}"),
+            (COL_EARN_DX, f"{term_earned:.2f}"),
+            (COL_GRADE_DX, f"{term_gpa:.3f}"),
+            (COL_POINTS_DX, f"{term_points:.3f}"),
+        ))
+        y -= TOTALS_DY
 
         # Cum totals line
-        y = self._get_current_y()
-        self.c.drawString(x, y, "Cum Totals:")
-        self.c.drawString(x + 2.0 * inch, y, f"{self.cum_attempted:.2f}")
-        self.c.drawString(x + 2.4 * inch, y, f"{self.cum_earned:.2f}")
-        self.c.drawString(x + 2.75 * inch, y, f"{cum_gpa:.3f}")
-        self.c.drawString(x + 3.1 * inch, y, f"{self.cum_points:.3f}")
-        self._advance_y(0.25 * inch)
+        self._draw_row(x, y, (
+            (0, "Cum Totals:"),
+            (COL_ATMPT_DX, f"{self.cum_attempted:.2f}"),
+            (COL_EARN_DX, f"{self.cum_earned:.2f}"),
+            (COL_GRADE_DX, f"{cum_gpa:.3f}"),
+            (COL_POINTS_DX, f"{self.cum_points:.3f}"),
+        ))
+        self._set_current_y(y - BLOCK_GAP_DY)
 
     def draw_semester(self, term, courses, is_transfer=False):
         """Draw a complete semester block."""
         # Estimate height needed for this semester
-        needed_height = 0.5 * inch + len(courses) * 0.15 * inch + 0.4 * inch
+        needed_height = SEMESTER_HEADER_HEIGHT + len(courses) * ROW_DY + SEMESTER_TOTALS_HEIGHT
         self._check_page_break(needed_height)
 
         self._draw_semester_header(term)
@@ -307,12 +428,12 @@ class TranscriptGenerator:
         term_earned = 0.0
         term_points = 0.0
 
+        draw_line = self._draw_transfer_course_line if is_transfer else self._draw_course_line
         for course in courses:
-            atmpt, earn, pts = self._draw_course_line(course, is_transfer)
+            atmpt, earn, pts = draw_line(course)
             term_attempted += atmpt
             term_earned += earn
-            if not is_transfer:
-                term_points += pts
+            term_points += pts
 
         self._draw_term_totals(term_attempted, term_earned, term_points)
 
@@ -326,31 +447,25 @@ class TranscriptGenerator:
         # Calculate final undergrad GPA
         final_gpa = self.cum_points / self.cum_gpa_units if self.cum_gpa_units > 0 else 0.0
 
-        self.c.setFont("Helvetica-Bold", 9)
-        self.c.drawString(x, y, "---------- Degrees Awarded ----------")
-        self._advance_y(0.2 * inch)
+        lines = [(x, y, "Helvetica-Bold", 9, "---------- Degrees Awarded ----------")]
+        y -= 0.2 * inch
 
-        self.c.setFont("Helvetica", 8)
-        y = self._get_current_y()
-        self.c.drawString(x, y, f"Degree: {degree}")
-        self._advance_y(0.15 * inch)
+        lines.append((x, y, "Helvetica", 8, f"Degree: {degree}"))
+        y -= ROW_DY
 
-        y = self._get_current_y()
-        self.c.drawString(x, y, f"Confer Date: {confer_date}")
-        self._advance_y(0.15 * inch)
+        lines.append((x, y, "Helvetica", 8, f"Confer Date: {confer_date}"))
+        y -= ROW_DY
 
-        y = self._get_current_y()
-        self.c.drawString(x, y, f"Degree GPA: {final_gpa:.3f}")
-        self._advance_y(0.15 * inch)
+        lines.append((x, y, "Helvetica", 8, f"Degree GPA: {final_gpa:.3f}"))
+        y -= ROW_DY
 
         if honours:
-            y = self._get_current_y()
-            self.c.drawString(x, y, f"Degree Honours: {honours}")
-            self._advance_y(0.15 * inch)
+            lines.append((x, y, "Helvetica", 8, f"Degree Honours: {honours}"))
+            y -= ROW_DY
 
-        y = self._get_current_y()
-        self.c.drawString(x, y, f"Plan: {plan}")
-        self._advance_y(0.25 * inch)
+        lines.append((x, y, "Helvetica", 8, f"Plan: {plan}"))
+        self._draw_text_block(lines)
+        self._set_current_y(y - BLOCK_GAP_DY)
 
     def _reset_cumulative_totals(self):
         """Reset cumulative totals for a new academic career (e.g., entering graduate school)."""
@@ -365,7 +480,7 @@ class TranscriptGenerator:
         x = self._get_current_x()
         y = self._get_current_y()
 
-        self.c.setFont("Helvetica-Bold", 8)
+        self._set_font("Helvetica-Bold", 8)
         self.c.drawString(x, y, f"Transfer Credit from {institution}")
         self._advance_y(0.2 * inch)
 
@@ -376,14 +491,14 @@ class TranscriptGenerator:
         term_earned = 0.0
 
         for course in courses:
-            atmpt, earn, _ = self._draw_course_line(course, is_transfer=True)
+            atmpt, earn, _ = self._draw_transfer_course_line(course)
             term_attempted += atmpt
             term_earned += earn
 
         # Update cumulative for transfer (no GPA impact)
         self.cum_attempted += term_attempted
         self.cum_earned += term_earned
-        self._advance_y(0.15 * inch)
+        self._advance_y(ROW_DY)
 
     def draw_undergrad_record(self, semesters=None, award_degree=True,
                                confer_date="May 2023", honours=None,
@@ -455,6 +570,11 @@ def create_transcript(filename, student_name, student_id, grad_semesters,
         undergrad_transfer_courses: Undergrad transfer credits (should be ignored by certifier)
         undergrad_transfer_institution: Institution for undergrad transfer credits
     """
+    for sem_data in grad_semesters:
+        prepare_courses(sem_data['courses'])
+    for courses in (transfer_courses, undergrad_transfer_courses):
+        if courses:
+            prepare_courses(courses)
     gen = TranscriptGenerator(filename, student_name, student_id)
 
     if include_undergrad:
@@ -474,364 +594,158 @@ def create_transcript(filename, student_name, student_id, grad_semesters,
 
 
 def generate_all_test_transcripts():
-    """Generate all 8 test transcript PDFs."""
+    """Generate all test transcript PDFs."""
 
     output_dir = Path("tests")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = []  # One create_transcript call per test case, rendered in parallel below
 
     # ==== PASSING CASES ====
 
     # 1. pass_standard.pdf - Full undergrad + grad record, meets all requirements
     # 18 core credits, 6 elective, 6 research = 30 total
-    grad_1 = [
-        {
-            'term': '2023 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '543', 'title': 'Quantum Mechanics I', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '561', 'title': 'Classical Mechanics', 'credits': 3, 'grade': 'A-'},
-            ]
-        },
-        {
-            'term': '2024 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '544', 'title': 'Quantum Mechanics II', 'credits': 3, 'grade': 'B+'},
-                {'dept': 'PHY', 'num': '521', 'title': 'Electrodynamics I', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '510', 'title': 'Mathematical Methods', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '522', 'title': 'Electrodynamics II', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '571', 'title': 'Statistical Mechanics', 'credits': 3, 'grade': 'A-'},
-                {'dept': 'EAS', 'num': '520', 'title': 'Earth System Science', 'credits': 3, 'grade': 'B+'},
-            ]
-        },
-        {
-            'term': '2025 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '690', 'title': 'Graduate Thesis', 'credits': 6, 'grade': 'A'},
-            ]
-        },
-    ]
-    create_transcript(
+    grad_1 = expand_semesters([
+        ('2023 Fall', [('PHY 543', 3, 'A'), ('PHY 561', 3, 'A-')]),
+        ('2024 Spring', [('PHY 544', 3, 'B+'), ('PHY 521', 3, 'A'), ('PHY 510', 3, 'A')]),
+        ('2024 Fall', [('PHY 522', 3, 'A'), ('PHY 571', 3, 'A-'), ('EAS 520', 3, 'B+')]),
+        ('2025 Spring', [('PHY 690', 6, 'A')]),
+    ])
+    jobs.append(partial(
+        create_transcript,
         output_dir / "pass_standard.pdf",
         "Test Student 001", "99990001",
         grad_1, include_undergrad=True,
         undergrad_honours="Magna Cum Laude",
         undergrad_confer_date="May 2023"
-    )
+    ))
 
     # 2. pass_grad_only.pdf - Graduate record only (no undergrad section)
     # 15 core + 3 400-level + 9 elective + 3 research = 30 total
-    grad_2 = [
-        {
-            'term': '2023 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '543', 'title': 'Quantum Mechanics I', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '561', 'title': 'Classical Mechanics', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '412', 'title': 'Elec & Magnt Fields II', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '544', 'title': 'Quantum Mechanics II', 'credits': 3, 'grade': 'A-'},
-                {'dept': 'PHY', 'num': '521', 'title': 'Electrodynamics I', 'credits': 3, 'grade': 'B+'},
-                {'dept': 'PHY', 'num': '510', 'title': 'Mathematical Methods', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '522', 'title': 'Electrodynamics II', 'credits': 3, 'grade': 'A'},
-                {'dept': 'EAS', 'num': '502', 'title': 'Earth Science', 'credits': 3, 'grade': 'A'},
-                {'dept': 'EAS', 'num': '520', 'title': 'Earth System Science', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2025 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '680', 'title': 'Independent Study', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-    ]
-    create_transcript(
+    grad_2 = expand_semesters([
+        ('2023 Fall', [('PHY 543', 3, 'A'), ('PHY 561', 3, 'A'), ('PHY 412', 3, 'A')]),
+        ('2024 Spring', [('PHY 544', 3, 'A-'), ('PHY 521', 3, 'B+'), ('PHY 510', 3, 'A')]),
+        ('2024 Fall', [('PHY 522', 3, 'A'), ('EAS 502', 3, 'A'), ('EAS 520', 3, 'A')]),
+        ('2025 Spring', [('PHY 680', 3, 'A')]),
+    ])
+    jobs.append(partial(
+        create_transcript,
         output_dir / "pass_grad_only.pdf",
         "Test Student 002", "99990002",
         grad_2, include_undergrad=False
-    )
+    ))
 
     # 3. pass_with_transfer.pdf - Includes transfer credits section
     # 15 core + 3 transfer core + 6 elective + 6 research = 30 total
-    grad_3 = [
-        {
-            'term': '2023 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '543', 'title': 'Quantum Mechanics I', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '561', 'title': 'Classical Mechanics', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '544', 'title': 'Quantum Mechanics II', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '521', 'title': 'Electrodynamics I', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '522', 'title': 'Electrodynamics II', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '510', 'title': 'Mathematical Methods', 'credits': 3, 'grade': 'A'},
-                {'dept': 'EAS', 'num': '520', 'title': 'Earth System Science', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2025 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '690', 'title': 'Graduate Thesis', 'credits': 6, 'grade': 'A'},
-            ]
-        },
-    ]
+    grad_3 = expand_semesters([
+        ('2023 Fall', [('PHY 543', 3, 'A'), ('PHY 561', 3, 'A')]),
+        ('2024 Spring', [('PHY 544', 3, 'A'), ('PHY 521', 3, 'A')]),
+        ('2024 Fall', [('PHY 522', 3, 'A'), ('PHY 510', 3, 'A'), ('EAS 520', 3, 'A')]),
+        ('2025 Spring', [('PHY 690', 6, 'A')]),
+    ])
     transfer_3 = [
         {'dept': 'PHY', 'num': '571', 'title': 'Statistical Mechanics', 'credits': 3},
     ]
-    create_transcript(
+    jobs.append(partial(
+        create_transcript,
         output_dir / "pass_with_transfer.pdf",
         "Test Student 003", "99990003",
         grad_3, include_undergrad=True,
         transfer_courses=transfer_3,
         transfer_institution="Riverside Community College"
-    )
+    ))
 
     # 4. pass_excess_research.pdf - More than 6 research credits (only 6 applied)
     # 18 core + 6 elective + 9 research = 33 total
-    grad_4 = [
-        {
-            'term': '2023 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '543', 'title': 'Quantum Mechanics I', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '561', 'title': 'Classical Mechanics', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '544', 'title': 'Quantum Mechanics II', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '521', 'title': 'Electrodynamics I', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '510', 'title': 'Mathematical Methods', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '522', 'title': 'Electrodynamics II', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '571', 'title': 'Statistical Mechanics', 'credits': 3, 'grade': 'A'},
-                {'dept': 'EAS', 'num': '520', 'title': 'Earth System Science', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2025 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '690', 'title': 'Graduate Thesis', 'credits': 6, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '680', 'title': 'Independent Study', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-    ]
-    create_transcript(
+    grad_4 = expand_semesters([
+        ('2023 Fall', [('PHY 543', 3, 'A'), ('PHY 561', 3, 'A')]),
+        ('2024 Spring', [('PHY 544', 3, 'A'), ('PHY 521', 3, 'A'), ('PHY 510', 3, 'A')]),
+        ('2024 Fall', [('PHY 522', 3, 'A'), ('PHY 571', 3, 'A'), ('EAS 520', 3, 'A')]),
+        ('2025 Spring', [('PHY 690', 6, 'A'), ('PHY 680', 3, 'A')]),
+    ])
+    jobs.append(partial(
+        create_transcript,
         output_dir / "pass_excess_research.pdf",
         "Test Student 004", "99990004",
         grad_4, include_undergrad=True
-    )
+    ))
 
     # ==== FAILING CASES ====
 
     # 5. fail_insufficient_core.pdf - Less than 15 core credits
     # 12 core + 12 elective + 6 research = 30 total
-    grad_5 = [
-        {
-            'term': '2023 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '543', 'title': 'Quantum Mechanics I', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '561', 'title': 'Classical Mechanics', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '544', 'title': 'Quantum Mechanics II', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '521', 'title': 'Electrodynamics I', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '510', 'title': 'Mathematical Methods', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Fall',
-            'courses': [
-                {'dept': 'EAS', 'num': '520', 'title': 'Earth System Science', 'credits': 3, 'grade': 'A'},
-                {'dept': 'EAS', 'num': '502', 'title': 'Earth Science', 'credits': 3, 'grade': 'A'},
-                {'dept': 'MTH', 'num': '573', 'title': 'Numerical Analysis', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2025 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '690', 'title': 'Graduate Thesis', 'credits': 6, 'grade': 'A'},
-            ]
-        },
-    ]
-    create_transcript(
+    grad_5 = expand_semesters([
+        ('2023 Fall', [('PHY 543', 3, 'A'), ('PHY 561', 3, 'A')]),
+        ('2024 Spring', [('PHY 544', 3, 'A'), ('PHY 521', 3, 'A'), ('PHY 510', 3, 'A')]),
+        ('2024 Fall', [('EAS 520', 3, 'A'), ('EAS 502', 3, 'A'), ('MTH 573', 3, 'A')]),
+        ('2025 Spring', [('PHY 690', 6, 'A')]),
+    ])
+    jobs.append(partial(
+        create_transcript,
         output_dir / "fail_insufficient_core.pdf",
         "Test Student 005", "99990005",
         grad_5, include_undergrad=True
-    )
+    ))
 
     # 6. fail_insufficient_total.pdf - Less than 30 total credits
     # 15 core + 6 elective + 6 research = 27 total
-    grad_6 = [
-        {
-            'term': '2023 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '543', 'title': 'Quantum Mechanics I', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '561', 'title': 'Classical Mechanics', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '544', 'title': 'Quantum Mechanics II', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '521', 'title': 'Electrodynamics I', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '510', 'title': 'Mathematical Methods', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '522', 'title': 'Electrodynamics II', 'credits': 3, 'grade': 'A'},
-                {'dept': 'EAS', 'num': '520', 'title': 'Earth System Science', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2025 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '690', 'title': 'Graduate Thesis', 'credits': 6, 'grade': 'A'},
-            ]
-        },
-    ]
-    create_transcript(
+    grad_6 = expand_semesters([
+        ('2023 Fall', [('PHY 543', 3, 'A'), ('PHY 561', 3, 'A')]),
+        ('2024 Spring', [('PHY 544', 3, 'A'), ('PHY 521', 3, 'A'), ('PHY 510', 3, 'A')]),
+        ('2024 Fall', [('PHY 522', 3, 'A'), ('EAS 520', 3, 'A')]),
+        ('2025 Spring', [('PHY 690', 6, 'A')]),
+    ])
+    jobs.append(partial(
+        create_transcript,
         output_dir / "fail_insufficient_total.pdf",
         "Test Student 006", "99990006",
         grad_6, include_undergrad=True
-    )
+    ))
 
     # 7. fail_excess_400level.pdf - More than 6 400-level credits
     # 15 core + 6 elective + 9 400-level = 30 total
-    grad_7 = [
-        {
-            'term': '2023 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '543', 'title': 'Quantum Mechanics I', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '561', 'title': 'Classical Mechanics', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '412', 'title': 'Elec & Magnt Fields II', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '544', 'title': 'Quantum Mechanics II', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '521', 'title': 'Electrodynamics I', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '415', 'title': 'Advanced Lab I', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '522', 'title': 'Electrodynamics II', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '510', 'title': 'Mathematical Methods', 'credits': 3, 'grade': 'A'},
-                {'dept': 'EAS', 'num': '520', 'title': 'Earth System Science', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '416', 'title': 'Advanced Lab II', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-    ]
-    create_transcript(
+    grad_7 = expand_semesters([
+        ('2023 Fall', [('PHY 543', 3, 'A'), ('PHY 561', 3, 'A'), ('PHY 412', 3, 'A')]),
+        ('2024 Spring', [('PHY 544', 3, 'A'), ('PHY 521', 3, 'A'), ('PHY 415', 3, 'A')]),
+        ('2024 Fall', [
+            ('PHY 522', 3, 'A'),
+            ('PHY 510', 3, 'A'),
+            ('EAS 520', 3, 'A'),
+            ('PHY 416', 3, 'A'),
+        ]),
+    ])
+    jobs.append(partial(
+        create_transcript,
         output_dir / "fail_excess_400level.pdf",
         "Test Student 007", "99990007",
         grad_7, include_undergrad=True
-    )
+    ))
 
     # 8. fail_invalid_course.pdf - Contains non-whitelisted external course
     # 15 core + 6 elective + 6 research + 3 invalid = 30 total
-    grad_8 = [
-        {
-            'term': '2023 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '543', 'title': 'Quantum Mechanics I', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '561', 'title': 'Classical Mechanics', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '544', 'title': 'Quantum Mechanics II', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '521', 'title': 'Electrodynamics I', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '510', 'title': 'Mathematical Methods', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '522', 'title': 'Electrodynamics II', 'credits': 3, 'grade': 'A'},
-                {'dept': 'EAS', 'num': '520', 'title': 'Earth System Science', 'credits': 3, 'grade': 'A'},
-                {'dept': 'BIO', 'num': '520', 'title': 'Advanced Biology', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2025 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '690', 'title': 'Graduate Thesis', 'credits': 6, 'grade': 'A'},
-            ]
-        },
-    ]
-    create_transcript(
+    grad_8 = expand_semesters([
+        ('2023 Fall', [('PHY 543', 3, 'A'), ('PHY 561', 3, 'A')]),
+        ('2024 Spring', [('PHY 544', 3, 'A'), ('PHY 521', 3, 'A'), ('PHY 510', 3, 'A')]),
+        ('2024 Fall', [('PHY 522', 3, 'A'), ('EAS 520', 3, 'A'), ('BIO 520', 3, 'A')]),
+        ('2025 Spring', [('PHY 690', 6, 'A')]),
+    ])
+    jobs.append(partial(
+        create_transcript,
         output_dir / "fail_invalid_course.pdf",
         "Test Student 008", "99990008",
         grad_8, include_undergrad=True
-    )
+    ))
 
     # 9. pass_undergrad_transfer_ignored.pdf - Has undergrad transfer credits that should be ignored
     # Tests that only graduate transfer credits (immediately before grad record) are counted
     # Undergrad transfers from "Bristol Community College" should be ignored
     # Grad transfers from "Other State University" should be counted
     # 15 core + 3 grad transfer core + 6 elective + 6 research = 30 total
-    grad_9 = [
-        {
-            'term': '2023 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '543', 'title': 'Quantum Mechanics I', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '561', 'title': 'Classical Mechanics', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '544', 'title': 'Quantum Mechanics II', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '521', 'title': 'Electrodynamics I', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2024 Fall',
-            'courses': [
-                {'dept': 'PHY', 'num': '522', 'title': 'Electrodynamics II', 'credits': 3, 'grade': 'A'},
-                {'dept': 'PHY', 'num': '510', 'title': 'Mathematical Methods', 'credits': 3, 'grade': 'A'},
-                {'dept': 'EAS', 'num': '520', 'title': 'Earth System Science', 'credits': 3, 'grade': 'A'},
-            ]
-        },
-        {
-            'term': '2025 Spring',
-            'courses': [
-                {'dept': 'PHY', 'num': '690', 'title': 'Graduate Thesis', 'credits': 6, 'grade': 'A'},
-            ]
-        },
-    ]
+    grad_9 = expand_semesters([
+        ('2023 Fall', [('PHY 543', 3, 'A'), ('PHY 561', 3, 'A')]),
+        ('2024 Spring', [('PHY 544', 3, 'A'), ('PHY 521', 3, 'A')]),
+        ('2024 Fall', [('PHY 522', 3, 'A'), ('PHY 510', 3, 'A'), ('EAS 520', 3, 'A')]),
+        ('2025 Spring', [('PHY 690', 6, 'A')]),
+    ])
     # Undergraduate transfer credits - these should be IGNORED by certifier
     # (they don't immediately precede the graduate record marker)
     undergrad_transfer_9 = [
@@ -844,7 +758,8 @@ def generate_all_test_transcripts():
     grad_transfer_9 = [
         {'dept': 'PHY', 'num': '571', 'title': 'Statistical Mechanics', 'credits': 3},
     ]
-    create_transcript(
+    jobs.append(partial(
+        create_transcript,
         output_dir / "pass_undergrad_transfer_ignored.pdf",
         "Test Student 009", "99990009",
         grad_9, include_undergrad=True,
@@ -852,9 +767,33 @@ def generate_all_test_transcripts():
         transfer_institution="Other State University",
         undergrad_transfer_courses=undergrad_transfer_9,
         undergrad_transfer_institution="Bristol Community College"
-    )
-
-    print(f"\nGenerated 9 test transcripts in {output_dir}/")
+    ))
+
+    # 10. fail_few_grad_courses.pdf - Two-column transcript with only 2 graduate courses
+    # 6 core = 6 total. Only the graduate column may be counted: full-width lines here would
+    # pair undergraduate rows with graduate ones.
+    grad_10 = expand_semesters([
+        ('2023 Fall', [('PHY 543', 3, 'A'), ('PHY 561', 3, 'A-')]),
+    ])
+    jobs.append(partial(
+        create_transcript,
+        output_dir / "fail_few_grad_courses.pdf",
+        "Test Student 010", "99990010",
+        grad_10, include_undergrad=True
+    ))
+
+    # Each transcript is an independent render, so build them in separate processes. On a
+    # single CPU they are rendered in-process, since workers would only add startup cost.
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for future in [executor.submit(job) for job in jobs]:
+                future.result()
+    else:
+        for job in jobs:
+            job()
+
+    print(f"\nGenerated {len(jobs)} test transcripts in {output_dir}/")
 
 
 if __name__ == "__main__":
@@ -6,15 +6,35 @@ Runs degree_certify.py on all test transcripts and verifies expected outcomes.
 Returns exit code 0 if all tests pass, 1 if any fail.
 """
 
-import subprocess
 import sys
+import io
 import csv
+import json
+import hashlib
+import argparse
+import traceback
 from pathlib import Path
-import shutil
+from collections import Counter, namedtuple
+from contextlib import redirect_stdout, redirect_stderr
+
+import pymupdf
+
+import degree_certify
 
 # Test output directory (separate from production output)
 TEST_OUTPUT_DIR = Path("test_output")
 
+# Results from the previous run, keyed by transcript and degree_certify.py content hashes
+# and the PyMuPDF version
+TEST_CACHE_PATH = TEST_OUTPUT_DIR / ".cache.json"
+
+# Outcome of one degree_certify run: exit status and captured console output
+CertificationRun = namedtuple("CertificationRun", "returncode stdout stderr")
+
+# Outcome of one test case; certification is the summary CSV's Certification value, or None
+# when no certification result was determined
+TestResult = namedtuple("TestResult", "test status message certification")
+
 # Define expected outcomes for each test case
 TEST_CASES = {
     "pass_standard.pdf": {
@@ -53,47 +73,168 @@ TEST_CASES = {
         "expected_pass": True,
         "description": "Undergrad transfer credits ignored, only grad transfer credits counted"
     },
+    "fail_few_grad_courses.pdf": {
+        "expected_pass": False,
+        # Reading across both columns would pick up undergrad courses and report an invalid course
+        "expected_certification": "Failed",
+        "description": "Two-column layout with only 2 graduate courses"
+    },
 }
 
+# Student ID of each test transcript, in TEST_CASES order (test N -> 9999NNNN, matching
+# the IDs written by generate_test_transcripts.py)
+STUDENT_IDS = tuple(f"9999{test_num:04d}" for test_num in range(1, len(TEST_CASES) + 1))
 
-def clean_output_directory():
-    """Remove any existing test output files to ensure clean test run."""
-    if TEST_OUTPUT_DIR.exists():
-        shutil.rmtree(TEST_OUTPUT_DIR)
-    TEST_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-
-def run_certification(pdf_path):
-    """Run degree_certify.py on a single PDF and return the result."""
-    result = subprocess.run(
-        [sys.executable, "degree_certify.py", "--output-dir", str(TEST_OUTPUT_DIR), str(pdf_path)],
-        capture_output=True,
-        text=True
-    )
-    return result
+def student_track_csvs(student_id):
+    """Return the track CSVs written for a student in the test output directory."""
+    return list(TEST_OUTPUT_DIR.glob(f"*_{student_id}_ms_phy_track.csv"))
 
 
-def parse_certification_result(student_id):
+def clean_output_directory(student_ids):
     """
-    Parse the certification_summary.csv to find the result for a given student ID.
-    Returns True if passed, False if failed, None if not found.
+    Remove the test output of the given students, their track CSVs and summary rows, so that
+    re-certifying them starts clean while the output of cached test cases is kept.
     """
+    TEST_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    student_ids = set(student_ids)
+    for student_id in student_ids:
+        for csv_path in student_track_csvs(student_id):
+            csv_path.unlink()
+
     summary_path = TEST_OUTPUT_DIR / "certification_summary.csv"
     if not summary_path.exists():
-        return None
-
-    with open(summary_path, "r") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row.get("Student ID") == student_id:
-                cert_status = row.get("Certification", "")
-                return cert_status == "Passed"
+        return
+    with open(summary_path, "r", newline="") as f:
+        rows = list(csv.reader(f))
+    header = rows[0] if rows else []
+    if "Student ID" not in header:
+        summary_path.unlink()
+        return
+    id_col = header.index("Student ID")
+    kept_rows = [row for row in rows[1:] if len(row) > id_col and row[id_col] not in student_ids]
+    if not kept_rows:
+        summary_path.unlink()
+        return
+    with open(summary_path, "w", newline="") as f:
+        csv.writer(f, lineterminator="\n").writerows([header, *kept_rows])
+
+
+def file_fingerprint(path):
+    """Return a content hash of a file, used to key cached test results."""
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def load_result_cache():
+    """Load cached certification results, or an empty cache if there is no usable one."""
+    try:
+        with open(TEST_CACHE_PATH, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def run_certification(pdf_paths, output_dir):
+    """
+    Run degree_certify's command-line entry point in-process on a batch of PDFs and return
+    the result, capturing its console output as a subprocess run would. Pool workers return
+    their output to main(), which prints it here, so it is captured whatever the start method.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            degree_certify.main(["--output-dir", str(output_dir), *map(str, pdf_paths)])
+        except SystemExit as e:
+            returncode = e.code or 0
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+    return CertificationRun(returncode, stdout.getvalue(), stderr.getvalue())
+
+
+def build_results_index(summary_path):
+    """
+    Read a certification_summary.csv in one pass and map each student ID to its Certification
+    value ("Passed", "Failed", ...). Returns an empty index if there is no summary.
+    """
+    if not summary_path.exists():
+        return {}
 
-    return None
+    with open(summary_path, "r", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if "Student ID" not in header or "Certification" not in header:
+            return {}
+        id_col = header.index("Student ID")
+        status_col = header.index("Certification")
+        return {row[id_col]: row[status_col] for row in reader if len(row) > status_col}
 
 
-def run_all_tests():
-    """Run all test cases and verify expected outcomes."""
+def check_test(test_num, pdf_name, test_info, pdf_path, cached_certification, run_result, results_index):
+    """
+    Report one test case and compare its certification outcome with the expected one.
+    The outcome is cached_certification if the transcript was not re-certified, otherwise
+    the student's entry in results_index from the batch run_result.
+    """
+    expected_pass = test_info["expected_pass"]
+    expected_certification = test_info.get("expected_certification")
+    description = test_info["description"]
+    student_id = STUDENT_IDS[test_num - 1]
+
+    print(f"\n[Test {test_num}/{len(TEST_CASES)}] {pdf_name}")
+    print(f"  Description: {description}")
+    print(f"  Expected: {'PASS' if expected_pass else 'FAIL'}")
+    if expected_certification:
+        print(f"  Expected certification: {expected_certification}")
+
+    if not pdf_path.exists():
+        print(f"  ERROR: PDF not found at {pdf_path}")
+        return TestResult(pdf_name, "ERROR", "PDF not found", None)
+
+    if cached_certification is not None:
+        print("  Using cached result (transcript and degree_certify.py unchanged)")
+        certification = cached_certification
+    else:
+        # Check for errors in execution
+        if run_result.returncode != 0 and "Error" in run_result.stderr:
+            print(f"  ERROR: Certification script failed")
+            print(f"  stderr: {run_result.stderr[:200]}")
+            return TestResult(pdf_name, "ERROR", "Script execution failed", None)
+
+        # Look up result in the summary CSV
+        certification = results_index.get(student_id)
+        if certification is None:
+            print(f"  ERROR: Could not determine certification result")
+            return TestResult(pdf_name, "ERROR", "Could not parse result", None)
+
+    # Compare expected vs actual
+    actual_pass = certification == "Passed"
+    if actual_pass != expected_pass:
+        print(f"  Result: {'PASS' if actual_pass else 'FAIL'}")
+        print(f"  Status: MISMATCH - expected {'PASS' if expected_pass else 'FAIL'}")
+        return TestResult(
+            pdf_name, "MISMATCH",
+            f"Expected {'PASS' if expected_pass else 'FAIL'}, got {'PASS' if actual_pass else 'FAIL'}",
+            certification
+        )
+
+    if expected_certification and certification != expected_certification:
+        print(f"  Result: {'PASS' if actual_pass else 'FAIL'} ({certification})")
+        print(f"  Status: MISMATCH - expected certification '{expected_certification}'")
+        return TestResult(
+            pdf_name, "MISMATCH",
+            f"Expected certification '{expected_certification}', got '{certification}'",
+            certification
+        )
+
+    print(f"  Result: {'PASS' if actual_pass else 'FAIL'} (as expected)")
+    print(f"  Status: OK")
+    return TestResult(pdf_name, "OK", f"Correctly {'passed' if expected_pass else 'failed'}", certification)
+
+
+def run_all_tests(use_cache=True):
+    """Run all test cases and verify expected outcomes, reusing cached results if use_cache."""
     print("=" * 60)
     print("Degree Certification Test Suite")
     print("=" * 60)
@@ -104,102 +245,68 @@ def run_all_tests():
         print("Run 'python generate_test_transcripts.py' first.")
         return 1
 
-    # Clean output directory for fresh run
-    clean_output_directory()
-
-    results = []
-    test_num = 0
-
-    for pdf_name, test_info in TEST_CASES.items():
-        test_num += 1
-        pdf_path = tests_dir / pdf_name
-        expected_pass = test_info["expected_pass"]
-        description = test_info["description"]
-
-        # Extract student ID from filename (last 3 digits of test number -> 9999000X)
-        student_id = f"9999000{test_num}"
-
-        print(f"\n[Test {test_num}/{len(TEST_CASES)}] {pdf_name}")
-        print(f"  Description: {description}")
-        print(f"  Expected: {'PASS' if expected_pass else 'FAIL'}")
-
-        if not pdf_path.exists():
-            print(f"  ERROR: PDF not found at {pdf_path}")
-            results.append({
-                "test": pdf_name,
-                "status": "ERROR",
-                "message": "PDF not found"
-            })
-            continue
+    # A test's result is reused while its transcript, degree_certify.py and the PyMuPDF version
+    # that extracts the text are all unchanged, and its track CSV is still in the output directory
+    cache = load_result_cache() if use_cache else {}
+    code_hash = file_fingerprint(Path(degree_certify.__file__))
+    pdf_paths = [tests_dir / pdf_name for pdf_name in TEST_CASES]
+    cache_keys = [
+        f"{file_fingerprint(pdf_path)}:{code_hash}:{pymupdf.VersionBind}" if pdf_path.exists() else None
+        for pdf_path in pdf_paths
+    ]
+    cached_certifications = [
+        cache.get(key) if student_track_csvs(student_id) else None
+        for key, student_id in zip(cache_keys, STUDENT_IDS)
+    ]
+
+    # Clear the previous output of every test case that is re-certified; cached cases keep
+    # their track CSVs and summary rows
+    clean_output_directory(
+        student_id for student_id, cached in zip(STUDENT_IDS, cached_certifications) if cached is None
+    )
 
-        # Run certification
-        run_result = run_certification(pdf_path)
+    # Certify every transcript without a cached result in a single degree_certify run, which
+    # processes the batch in parallel itself and writes one summary CSV for all of them
+    pending = [pdf_path for pdf_path, cache_key, cached in zip(pdf_paths, cache_keys, cached_certifications)
+               if cache_key and cached is None]
+    run_result = run_certification(pending, TEST_OUTPUT_DIR) if pending else None
+    results_index = build_results_index(TEST_OUTPUT_DIR / "certification_summary.csv")
 
-        # Check for errors in execution
-        if run_result.returncode != 0 and "Error" in run_result.stderr:
-            print(f"  ERROR: Certification script failed")
-            print(f"  stderr: {run_result.stderr[:200]}")
-            results.append({
-                "test": pdf_name,
-                "status": "ERROR",
-                "message": "Script execution failed"
-            })
-            continue
-
-        # Parse result from summary CSV
-        actual_pass = parse_certification_result(student_id)
-
-        if actual_pass is None:
-            # Try to determine from stdout
-            if "Certification PASSED" in run_result.stdout:
-                actual_pass = True
-            elif "Certification FAILED" in run_result.stdout:
-                actual_pass = False
-            else:
-                print(f"  ERROR: Could not determine certification result")
-                results.append({
-                    "test": pdf_name,
-                    "status": "ERROR",
-                    "message": "Could not parse result"
-                })
-                continue
-
-        # Compare expected vs actual
-        if actual_pass == expected_pass:
-            print(f"  Result: {'PASS' if actual_pass else 'FAIL'} (as expected)")
-            print(f"  Status: OK")
-            results.append({
-                "test": pdf_name,
-                "status": "OK",
-                "message": f"Correctly {'passed' if expected_pass else 'failed'}"
-            })
-        else:
-            print(f"  Result: {'PASS' if actual_pass else 'FAIL'}")
-            print(f"  Status: MISMATCH - expected {'PASS' if expected_pass else 'FAIL'}")
-            results.append({
-                "test": pdf_name,
-                "status": "MISMATCH",
-                "message": f"Expected {'PASS' if expected_pass else 'FAIL'}, got {'PASS' if actual_pass else 'FAIL'}"
-            })
+    results = []
+    new_cache = {}
+    for test_num, (pdf_name, test_info) in enumerate(TEST_CASES.items(), 1):
+        result = check_test(test_num, pdf_name, test_info, pdf_paths[test_num - 1],
+                            cached_certifications[test_num - 1], run_result, results_index)
+        results.append(result)
+        cache_key = cache_keys[test_num - 1]
+        if cache_key and result.certification is not None:
+            new_cache[cache_key] = result.certification
+
+    with open(TEST_CACHE_PATH, "w") as f:
+        json.dump(new_cache, f, indent=2)
 
     # Summary
     print("\n" + "=" * 60)
     print("TEST SUMMARY")
     print("=" * 60)
 
-    ok_count = sum(1 for r in results if r["status"] == "OK")
-    error_count = sum(1 for r in results if r["status"] == "ERROR")
-    mismatch_count = sum(1 for r in results if r["status"] == "MISMATCH")
+    status_counts = Counter(r.status for r in results)
+    ok_count = status_counts["OK"]
+    error_count = status_counts["ERROR"]
+    mismatch_count = status_counts["MISMATCH"]
 
     print(f"  Passed: {ok_count}/{len(TEST_CASES)}")
     print(f"  Errors: {error_count}")
     print(f"  Mismatches: {mismatch_count}")
+    cached_count = sum(certification is not None for certification in cached_certifications)
+    if cached_count:
+        print(f"  From cache: {cached_count} (not re-certified; use --no-cache to certify all)")
 
     if error_count > 0 or mismatch_count > 0:
         print("\nFailed tests:")
         for r in results:
-            if r["status"] != "OK":
-                print(f"  - {r['test']}: {r['status']} - {r['message']}")
+            if r.status != "OK":
+                print(f"  - {r.test}: {r.status} - {r.message}")
         print("\nTEST SUITE FAILED")
         return 1
     else:
@@ -208,4 +315,8 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
-    sys.exit(run_all_tests())
+    parser = argparse.ArgumentParser(description="Run the degree certification test suite.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Certify every transcript even if a cached result is available")
+    args = parser.parse_args()
+    sys.exit(run_all_tests(use_cache=not args.no_cache))